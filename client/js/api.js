@@ -20,21 +20,44 @@ function ensureUserIdentity() {
   
   return { userId, userEmail };
 }
+
+// Bodies smaller than this are sent as-is; gzip overhead isn't worth it.
+const COMPRESS_MIN_BYTES = 1024;
+
+// gzip the JSON body when the browser supports CompressionStream.
+// Returns { body, encoding } where encoding is 'gzip' or null.
+async function encodeBody(payload) {
+  const json = JSON.stringify(payload);
+  if (typeof CompressionStream === 'undefined' || json.length < COMPRESS_MIN_BYTES) {
+    return { body: json, encoding: null };
+  }
+  try {
+    const stream = new Blob([json]).stream().pipeThrough(new CompressionStream('gzip'));
+    const body = await new Response(stream).arrayBuffer();
+    return { body, encoding: 'gzip' };
+  } catch (e) {
+    return { body: json, encoding: null };
+  }
+}
+
 export async function streamConversation(payload, onChunk, signal) {
   const url = '/backend-api/v2/conversation';
   const { userId, userEmail } = ensureUserIdentity();
   const teamId = localStorage.getItem("team_id") || null;
+  const { body, encoding } = await encodeBody(payload);
 
+  const headers = {
+    'Content-Type': 'application/json',
+    'Accept': 'text/event-stream',
+    'X-User-ID': userId,
+    'X-User-Email': userEmail,
+    'X-Team-ID': teamId };
+  if (encoding) headers['Content-Encoding'] = encoding;
 
   const res = await fetch(url, {
     method: 'POST',
-    headers: {
-      'Content-Type': 'application/json',
-      'Accept': 'text/event-stream',
-      'X-User-ID': userId,
-      'X-User-Email': userEmail,
-      'X-Team-ID': teamId },
-    body: JSON.stringify(payload),
+    headers,
+    body,
     signal
   });
 
@@ -9,6 +9,8 @@ from flask import Flask, render_template, send_file, redirect
 from server.controller.conversation_controller import ConversationController
 from server.controller.teams_memory_controller import TeamsMemoryController
 from server.controller.teams_db_controller import TeamsDBController
+from server.controller.profiles_controller import ProfilesController
+from server.services import compression_service, logging_service, profiling_service
 from dotenv import load_dotenv 
 
 # Load the .env file
@@ -87,6 +89,22 @@ def assets(folder: str, file: str):
     return send_file(str(filepath), as_attachment=False)
 
 
+# --- LOGGING (request id, timing, sampling) ---
+
+logging_service.init_app(app)
+
+
+# --- PROFILING (opt-in via X-Profile header or PROFILE_SAMPLE_RATE) ---
+
+profiling_service.init_app(app)
+ProfilesController(app)
+
+
+# --- COMPRESSION (gzip/br request bodies, compressed JSON responses) ---
+
+compression_service.init_app(app)
+
+
 # --- API CONTROLLERS (unchanged behavior) ---
 
 # Conversation API routes
@@ -1,5 +1,6 @@
 # server/config.py
 import os
+import sys
 from dotenv import load_dotenv
 
 # Load environment variables from a local .env file (for dev)
@@ -26,4 +27,74 @@ if not GEMINI_API_KEY:
 
 # Single model this app uses for all Gemini calls.
 # If you ever want to switch models, change this string.
-GEMINI_MODEL = "gemini-2.5-flash"
\ No newline at end of file
+GEMINI_MODEL = "gemini-2.5-flash"
+
+# --- LOGGING ---------------------------------------------------------------
+
+# Minimum level for the app's JSON log lines (DEBUG, INFO, WARNING, ERROR).
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+
+# Fraction of requests whose DEBUG/INFO lines are kept (0.0 - 1.0).
+# WARNING and above are always written.
+LOG_SAMPLE_RATE = float(os.getenv("LOG_SAMPLE_RATE", "1.0"))
+
+# Max number of records waiting for the writer thread. When full, new
+# records are dropped instead of blocking the request.
+LOG_QUEUE_SIZE = int(os.getenv("LOG_QUEUE_SIZE", "10000"))
+
+
+# --- PROFILING -------------------------------------------------------------
+
+# Directory where per-request profiles are written (/tmp is writable on Vercel).
+PROFILE_DIR = os.getenv("PROFILE_DIR", "/tmp/overlap-profiles")
+
+# Shared secret. A request sending "X-Profile: <token>" is profiled, and the
+# token is required to read /backend-api/v2/profiles. Unset = header disabled.
+PROFILE_TOKEN = os.getenv("PROFILE_TOKEN")
+
+# Fraction of requests profiled automatically (0.0 = off).
+PROFILE_SAMPLE_RATE = float(os.getenv("PROFILE_SAMPLE_RATE", "0.0"))
+
+# "pstats" (cProfile, open with snakeviz / pstats) or "collapsed"
+# (sampled stacks, feed to flamegraph.pl or speedscope).
+# From Python 3.12 cProfile records every thread in the process, so a pstats
+# profile also contains concurrent requests and the log writer thread. The
+# collapsed sampler only follows the request's own thread, so it is the
+# default there.
+PROFILE_FORMAT = os.getenv("PROFILE_FORMAT", "collapsed" if sys.version_info >= (3, 12) else "pstats")
+
+# Sampling interval for the "collapsed" format, in seconds.
+PROFILE_INTERVAL = float(os.getenv("PROFILE_INTERVAL", "0.005"))
+
+# How many profile files to keep in PROFILE_DIR.
+PROFILE_KEEP = int(os.getenv("PROFILE_KEEP", "50"))
+
+
+# --- COMPRESSION -----------------------------------------------------------
+
+# Largest request body we will inflate from gzip/br, in bytes. Protects
+# against decompression bombs.
+MAX_DECOMPRESSED_BODY = int(os.getenv("MAX_DECOMPRESSED_BODY", str(10 * 1024 * 1024)))
+
+# Largest compressed request body we will read, in bytes.
+MAX_COMPRESSED_BODY = int(os.getenv("MAX_COMPRESSED_BODY", str(2 * 1024 * 1024)))
+
+# JSON responses smaller than this (bytes) are sent uncompressed.
+COMPRESS_MIN_SIZE = int(os.getenv("COMPRESS_MIN_SIZE", "1024"))
+
+# gzip level (1-9) and brotli quality (0-11) for responses.
+GZIP_LEVEL = int(os.getenv("GZIP_LEVEL", "6"))
+BROTLI_QUALITY = int(os.getenv("BROTLI_QUALITY", "5"))
+
+
+# --- TEAM CACHE ------------------------------------------------------------
+
+# Seconds a cached team row is trusted while the LISTEN/NOTIFY connection is
+# down. While it is up, rows stay cached until a team_changed notification.
+TEAM_CACHE_TTL = float(os.getenv("TEAM_CACHE_TTL", "30"))
+
+# How often (seconds) the idle listener connection is checked for liveness.
+TEAM_CACHE_KEEPALIVE = float(os.getenv("TEAM_CACHE_KEEPALIVE", "30"))
+
+# Max team rows cached per worker (least recently used are evicted).
+TEAM_CACHE_MAX_ENTRIES = int(os.getenv("TEAM_CACHE_MAX_ENTRIES", "1024"))
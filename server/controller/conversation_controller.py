@@ -1,9 +1,13 @@
 # controllers/conversation_controller.py
-from flask import request
+from flask import request, stream_with_context
 from json import dumps
+from time import perf_counter
 from server.services import gemini_service, prompt_service
+from server.services.logging_service import get_logger
 import server.config  as config 
 
+logger = get_logger(__name__)
+
 class ConversationController:
     def __init__(self, app):
         self.app = app
@@ -53,11 +57,19 @@ class ConversationController:
             # print("Using Model:", model)  # Debug print
             # print("Using Gemini Key:", api_key is not None)  # Debug print
             # 6. Get the streaming response (using our service)
+            upstream_start = perf_counter()
             response = gemini_service.stream_gemini_response(
                 'gemini-2.5-flash', 
                 payload_body, 
                 api_key, 
             )
+            logger.info(
+                "Gemini stream opened",
+                extra={
+                    'upstream_status': response.status_code,
+                    'duration_ms': round((perf_counter() - upstream_start) * 1000, 2),
+                },
+            )
 
             # 7. Check for upstream errors
             if response.status_code >= 400:
@@ -71,13 +83,13 @@ class ConversationController:
                 }, response.status_code
 
             # 8. Process the stream (using our service)
-            stream_generator = gemini_service.process_stream_events(response)
+            # stream_with_context keeps request_id/route on log lines emitted mid-stream
+            stream_generator = stream_with_context(gemini_service.process_stream_events(response))
             
             return self.app.response_class(stream_generator, mimetype='text/event-stream')
 
         except Exception as e:
-            print(f"Error in conversation controller: {e}")
-            print(e.__traceback__.tb_next)
+            logger.exception("Error in conversation controller: %s", e)
             return {
                 '_action': '_ask',
                 'success': False,
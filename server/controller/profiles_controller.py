@@ -0,0 +1,27 @@
+from flask import request, send_file
+from server.services import profiling_service
+from server.services.profiling_service import PROFILES_ROUTE
+
+
+class ProfilesController:
+    def __init__(self, app):
+        self.app = app
+        app.add_url_rule(PROFILES_ROUTE, view_func=self.list_profiles, methods=['GET'])
+        app.add_url_rule(f'{PROFILES_ROUTE}/<name>', view_func=self.get_profile, methods=['GET'])
+
+    def list_profiles(self):
+        if not profiling_service.is_authorized(request):
+            return {'success': False, 'error': 'forbidden'}, 403
+        try:
+            limit = int(request.args.get('limit', 50))
+            return {'success': True, 'profiles': profiling_service.list_profiles(limit)}, 200
+        except Exception as e:
+            return {'success': False, 'error': str(e)}, 500
+
+    def get_profile(self, name):
+        if not profiling_service.is_authorized(request):
+            return {'success': False, 'error': 'forbidden'}, 403
+        path = profiling_service.profile_path(name)
+        if path is None:
+            return {'success': False, 'error': 'profile not found'}, 404
+        return send_file(path, as_attachment=True)
@@ -5,8 +5,10 @@ from contextlib import contextmanager
 from psycopg2.pool import ThreadedConnectionPool
 import os
 from dotenv import load_dotenv
+from server.services.logging_service import get_logger
 
 load_dotenv()
+logger = get_logger(__name__)
 
 # Database configuration
 DB_CONFIG = {
@@ -28,9 +30,9 @@ try:
         maxconn=20, 
         **DB_CONFIG
     )
-    print("Connection pool created successfully.")
+    logger.info("Connection pool created successfully.")
 except (Exception, psycopg2.DatabaseError) as error:
-    print(f"Error while creating connection pool: {error}")
+    logger.error("Error while creating connection pool: %s", error)
     connection_pool = None
 
 @contextmanager
@@ -105,4 +107,4 @@ def close_all_connections():
     """
     if connection_pool:
         connection_pool.closeall()
-        print("Connection pool closed.")
\ No newline at end of file
+        logger.info("Connection pool closed.")
\ No newline at end of file
@@ -0,0 +1,155 @@
+import select
+import threading
+from collections import OrderedDict
+from time import monotonic
+from typing import Any, Dict, List, Optional
+
+import psycopg2
+from psycopg2.extensions import ISOLATION_LEVEL_AUTOCOMMIT
+
+import server.config as config
+from server.model.db_model import DB_CONFIG
+from server.services.logging_service import get_logger
+
+logger = get_logger(__name__)
+
+# Postgres channel teams_model publishes on after a team row changes.
+# The payload is the team_id.
+TEAM_CHANNEL = 'team_changed'
+
+
+class TeamCache:
+    """
+    Per-worker cache of team_skills rows, kept coherent across workers by a
+    background thread that LISTENs on TEAM_CHANNEL.
+
+    While the listener is connected, entries live until a notification for
+    their team arrives. If the connection drops, entries fall back to
+    expiring after `ttl` seconds until the listener reconnects. At most
+    `max_entries` teams are kept; the least recently used is evicted first.
+    """
+
+    def __init__(self, ttl: float, keepalive: float, max_entries: int):
+        self.ttl = ttl
+        self.keepalive = keepalive
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[int, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._version = 0
+        self._listening = False
+        self._thread = None
+        self._stop = threading.Event()
+
+    @property
+    def version(self) -> int:
+        """Bumped on every invalidation. Pass to put() to drop fills that raced one."""
+        return self._version
+
+    @staticmethod
+    def _key(team_id) -> Optional[int]:
+        # team_id arrives as a header string or a notify payload; "05" and 5
+        # must hit the same entry.
+        try:
+            return int(team_id)
+        except (TypeError, ValueError):
+            return None
+
+    def get(self, team_id) -> Optional[List[Dict[str, Any]]]:
+        key = self._key(team_id)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            rows, fetched_at = entry
+            if not self._listening and monotonic() - fetched_at >= self.ttl:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return rows
+
+    def put(self, team_id, rows: List[Dict[str, Any]], version: int):
+        key = self._key(team_id)
+        if key is None:
+            return
+        with self._lock:
+            if version == self._version:
+                self._entries[key] = (rows, monotonic())
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+
+    def invalidate(self, team_id):
+        with self._lock:
+            self._version += 1
+            self._entries.pop(self._key(team_id), None)
+
+    def clear(self):
+        with self._lock:
+            self._version += 1
+            self._entries.clear()
+
+    def start(self):
+        """Start the listener thread. Safe to call more than once."""
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._listen, name='team-cache-listener', daemon=True)
+                self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    def _liveness_options(self) -> Dict[str, int]:
+        """
+        libpq TCP options so a silently dropped connection (NAT timeout,
+        failover) errors out well within `ttl`. Without them the keepalive
+        query can hang for the kernel's retransmit timeout (~15 minutes),
+        and entries keep being served without expiry all that time.
+        """
+        return {
+            'keepalives': 1,
+            'keepalives_idle': max(1, int(self.ttl / 4)),
+            'keepalives_interval': max(1, int(self.ttl / 8)),
+            'keepalives_count': 3,
+            'tcp_user_timeout': max(1000, int(self.ttl * 1000 / 2)),
+        }
+
+    def _listen(self):
+        backoff = 1
+        while not self._stop.is_set():
+            conn = None
+            try:
+                # Dedicated connection: LISTEN needs it for the worker's lifetime,
+                # so it must not come from the request pool.
+                conn = psycopg2.connect(**DB_CONFIG, **self._liveness_options())
+                conn.set_isolation_level(ISOLATION_LEVEL_AUTOCOMMIT)
+                with conn.cursor() as cur:
+                    cur.execute(f"LISTEN {TEAM_CHANNEL};")
+                # Anything cached before this point may have missed a notification.
+                self.clear()
+                self._listening = True
+                backoff = 1
+                logger.info("Team cache listener connected")
+
+                while not self._stop.is_set():
+                    if select.select([conn], [], [], self.keepalive) == ([], [], []):
+                        # Notifications that arrive during this query land in
+                        # conn.notifies, so they are drained below as well.
+                        with conn.cursor() as cur:
+                            cur.execute("SELECT 1;")
+                    else:
+                        conn.poll()
+                    while conn.notifies:
+                        self.invalidate(conn.notifies.pop(0).payload)
+            except Exception as e:
+                logger.warning("Team cache listener disconnected, using TTL expiry: %s", e)
+            finally:
+                self._listening = False
+                if conn is not None:
+                    conn.close()
+            self._stop.wait(backoff)
+            backoff = min(backoff * 2, 60)
+
+
+team_cache = TeamCache(config.TEAM_CACHE_TTL, config.TEAM_CACHE_KEEPALIVE, config.TEAM_CACHE_MAX_ENTRIES)
@@ -1,7 +1,10 @@
-import sys
 from typing import List, Dict, Any, Optional
 from psycopg2.extras import Json
 from server.model.db_model import get_db_cursor
+from server.model.team_cache import team_cache, TEAM_CHANNEL
+from server.services.logging_service import get_logger
+
+logger = get_logger(__name__)
 
 def ensure_team_table():
     """Create the team_skills table if it does not exist and ensure new columns are present."""
@@ -21,17 +24,36 @@ def ensure_team_table():
         cur.execute("ALTER TABLE team_skills ADD COLUMN IF NOT EXISTS member_limit INTEGER;")
 
 
+def _notify_team_changed(cur, team_id):
+    """
+    Publish a team_changed notification. Postgres delivers it when the
+    surrounding transaction commits, so other workers never see it early.
+    """
+    cur.execute("SELECT pg_notify(%s, %s);", (TEAM_CHANNEL, str(team_id)))
+
+
 def get_team_skills_data(team_id: str) -> List[Dict[str, Any]]:
-    """Fetch all teams from the database. Returns an empty list on error."""
+    """
+    Fetch a team's row, served from the per-worker team cache when possible.
+    Returns an empty list on error.
+    """
+    team_cache.start()
+    cached = team_cache.get(team_id)
+    if cached is not None:
+        return list(cached)
     try:
+        version = team_cache.version
         ensure_team_table()
         with get_db_cursor(dict_cursor=True) as (conn, cur):
             # CHANGE: Use %s instead of ? for PostgreSQL
             cur.execute("SELECT * FROM team_skills WHERE team_id = %s", (team_id,))
             rows = cur.fetchall() or []
-            return rows
+        # Empty results (unknown team) aren't cached.
+        if rows:
+            team_cache.put(team_id, rows, version)
+        return list(rows)
     except Exception as e:
-        print(f"Error fetching team skills data: {e}", file=sys.stderr)
+        logger.error("Error fetching team skills data: %s", e, extra={'team_id': team_id})
         return []
 
 
@@ -48,9 +70,16 @@ def create_team(team_name: str, member_limit: Optional[int] = None) -> Optional[
                 (team_name, Json({}), Json({}), Json({}), member_limit)
             )
             row = cur.fetchone()
-            return row.get('team_id') if row else None
+            team_id = row.get('team_id') if row else None
+            if team_id is not None:
+                _notify_team_changed(cur, team_id)
+        # Invalidate only after commit, so a concurrent read can't re-cache the
+        # old row. Don't wait for our own listener (or for TTL if it is down).
+        if team_id is not None:
+            team_cache.invalidate(team_id)
+        return team_id
     except Exception as e:
-        print(f"Error creating team: {e}", file=sys.stderr)
+        logger.error("Error creating team: %s", e)
         return None
 
 
@@ -62,7 +91,7 @@ def list_teams() -> List[Dict[str, Any]]:
             rows = cur.fetchall() or []
             return rows
     except Exception as e:
-        print(f"Error fetching team skills data: {e}", file=sys.stderr)
+        logger.error("Error listing teams: %s", e)
         return []
 
 
@@ -74,6 +103,7 @@ def add_member(team_id: int, user_key: str, user_email: str) -> bool:
     """
     try:
         ensure_team_table()
+        changed = False
         with get_db_cursor(dict_cursor=True) as (conn, cur):
             # 1. Fetch current team data
             cur.execute("SELECT user_id, member_limit FROM team_skills WHERE team_id = %s;", (team_id,))
@@ -93,19 +123,26 @@ def add_member(team_id: int, user_key: str, user_email: str) -> bool:
                         "UPDATE team_skills SET user_id = %s WHERE team_id = %s;",
                         (Json(current_members), team_id)
                     )
-                return True
+                    _notify_team_changed(cur, team_id)
+                    changed = True
             
             # 3. Check limit
-            if limit is not None and len(current_members) >= limit:
+            elif limit is not None and len(current_members) >= limit:
                 return False
 
             # 4. Add member
-            current_members[user_key] = user_email
-            cur.execute(
-                "UPDATE team_skills SET user_id = %s WHERE team_id = %s;",
-                (Json(current_members), team_id)
-            )
-            return True
+            else:
+                current_members[user_key] = user_email
+                cur.execute(
+                    "UPDATE team_skills SET user_id = %s WHERE team_id = %s;",
+                    (Json(current_members), team_id)
+                )
+                _notify_team_changed(cur, team_id)
+                changed = True
+        # Invalidate only after commit (see create_team).
+        if changed:
+            team_cache.invalidate(team_id)
+        return True
     except Exception as e:
-        print(f"Error adding member: {e}", file=sys.stderr)
+        logger.error("Error adding member: %s", e, extra={'team_id': team_id})
         return False
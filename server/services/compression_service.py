@@ -0,0 +1,148 @@
+# services/compression_service.py
+import gzip
+import io
+import json
+import zlib
+
+from flask import request
+
+import server.config as config
+
+try:
+    import brotli
+except ImportError:  # br support is optional; gzip always works
+    brotli = None
+
+class BodyTooLarge(Exception):
+    pass
+
+
+def decompress_body(data: bytes, encoding: str, limit: int) -> bytes:
+    """
+    Decode a gzip or br request body. Output is capped at `limit` + 1 bytes
+    while decoding, so a decompression bomb never gets inflated in full.
+    """
+    if encoding == 'gzip':
+        # A gzip stream may be several concatenated members; decode them all
+        # against the same limit.
+        body = b''
+        while True:
+            d = zlib.decompressobj(16 + zlib.MAX_WBITS)
+            body += d.decompress(data, limit + 1 - len(body))
+            if len(body) > limit:
+                raise BodyTooLarge()
+            if not d.eof:
+                raise ValueError('truncated gzip body')
+            data = d.unused_data
+            if not data:
+                return body
+    if encoding == 'br':
+        d = brotli.Decompressor()
+        body = d.process(data, output_buffer_limit=limit + 1)
+        if len(body) > limit:
+            raise BodyTooLarge()
+        if not d.is_finished():
+            raise ValueError('truncated br body')
+        return body
+    raise ValueError(f'unsupported encoding {encoding}')
+
+
+def _supported_encodings():
+    return ('br', 'gzip') if brotli else ('gzip',)
+
+
+class DecompressRequestMiddleware:
+    """
+    WSGI middleware that inflates `Content-Encoding: gzip` / `br` request
+    bodies before Flask sees them, so request.json keeps working unchanged.
+    """
+
+    def __init__(self, wsgi_app, limit: int, max_input: int):
+        self.wsgi_app = wsgi_app
+        self.limit = limit
+        self.max_input = max_input
+
+    def __call__(self, environ, start_response):
+        encoding = environ.get('HTTP_CONTENT_ENCODING', '').strip().lower()
+        if not encoding or encoding == 'identity':
+            return self.wsgi_app(environ, start_response)
+        if encoding not in _supported_encodings():
+            return self._error(start_response, '415 Unsupported Media Type', f'unsupported Content-Encoding: {encoding}')
+
+        raw_length = environ.get('CONTENT_LENGTH')
+        if raw_length:
+            try:
+                length = int(raw_length)
+                if length < 0:
+                    raise ValueError()
+            except ValueError:
+                return self._error(start_response, '400 Bad Request', 'malformed Content-Length')
+            if length > self.max_input:
+                return self._error(start_response, '413 Payload Too Large', 'compressed body too large')
+            raw = environ['wsgi.input'].read(length) if length else b''
+        elif environ.get('wsgi.input_terminated'):
+            # Chunked body: the server signals EOF, so read one byte past the
+            # cap to detect overflow.
+            raw = environ['wsgi.input'].read(self.max_input + 1)
+            if len(raw) > self.max_input:
+                return self._error(start_response, '413 Payload Too Large', 'compressed body too large')
+        else:
+            # Reading without a length would block until the client hangs up.
+            return self._error(start_response, '411 Length Required', 'Content-Length required')
+
+        try:
+            # An empty body (Content-Length: 0) stays empty.
+            body = decompress_body(raw, encoding, self.limit) if raw else b''
+        except BodyTooLarge:
+            return self._error(start_response, '413 Payload Too Large', 'decompressed body too large')
+        except Exception as e:
+            return self._error(start_response, '400 Bad Request', f'could not decode body: {e}')
+
+        environ['wsgi.input'] = io.BytesIO(body)
+        environ['CONTENT_LENGTH'] = str(len(body))
+        del environ['HTTP_CONTENT_ENCODING']
+        return self.wsgi_app(environ, start_response)
+
+    @staticmethod
+    def _error(start_response, status, message):
+        body = json.dumps({'success': False, 'error': message}).encode()
+        start_response(status, [('Content-Type', 'application/json'), ('Content-Length', str(len(body)))])
+        return [body]
+
+
+def _compress_response(response):
+    # Streams (SSE) are left alone: compressing them would buffer chunks
+    # and delay tokens reaching the browser.
+    if (
+        response.is_streamed
+        or response.mimetype != 'application/json'
+        or response.status_code < 200
+        or response.status_code in (204, 304)
+        or 'Content-Encoding' in response.headers
+    ):
+        return response
+
+    response.vary.add('Accept-Encoding')
+    data = response.get_data()
+    if len(data) < config.COMPRESS_MIN_SIZE:
+        return response
+
+    encoding = request.accept_encodings.best_match(_supported_encodings())
+    if encoding == 'br':
+        data = brotli.compress(data, quality=config.BROTLI_QUALITY)
+    elif encoding == 'gzip':
+        data = gzip.compress(data, compresslevel=config.GZIP_LEVEL)
+    else:
+        return response
+
+    response.set_data(data)
+    response.headers['Content-Encoding'] = encoding
+    return response
+
+
+def init_app(app):
+    """Accept compressed request bodies and compress large JSON responses."""
+    app.wsgi_app = DecompressRequestMiddleware(
+        app.wsgi_app, config.MAX_DECOMPRESSED_BODY, config.MAX_COMPRESSED_BODY
+    )
+    app.after_request(_compress_response)
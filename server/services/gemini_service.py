@@ -1,6 +1,9 @@
 # services/gemini_service.py
 import requests
 from json import dumps, loads
+from server.services.logging_service import get_logger
+
+logger = get_logger(__name__)
 
 # This is just creating the "system" prompt with context 
 def prepare_payload(conversation: list, system_message: str, generation_config: dict = None):
@@ -91,5 +94,5 @@ def process_stream_events(response):
     except GeneratorExit:
         return
     except Exception as e:
-        print(f'Gemini stream error: {e}')
+        logger.error("Gemini stream error: %s", e)
         return
\ No newline at end of file
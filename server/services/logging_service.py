@@ -0,0 +1,180 @@
+# services/logging_service.py
+import atexit
+import json
+import logging
+import queue
+import re
+import sys
+import uuid
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from random import random
+from time import perf_counter
+
+from flask import g, has_request_context, request
+from flask.logging import default_handler
+
+import server.config as config
+
+# All app modules log under "server.*" (they use get_logger(__name__)),
+# so this is the only logger we need to configure.
+ROOT_LOGGER_NAME = "server"
+
+# Attributes every LogRecord has. Anything else on a record came from
+# `extra=` and is written out as a structured field.
+_RESERVED_ATTRS = set(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime"}
+
+# Client-supplied X-Request-ID values are only trusted if they look like this.
+_REQUEST_ID_RE = re.compile(r'^[A-Za-z0-9-]{1,64}$')
+
+_listener = None
+_queue_handler = None
+
+
+class JsonFormatter(logging.Formatter):
+    """Formats a record as a single JSON line."""
+
+    def format(self, record):
+        entry = {
+            'ts': datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat(),
+            'level': record.levelname,
+            'logger': record.name,
+            'msg': record.getMessage(),
+        }
+        for key, value in vars(record).items():
+            if key not in _RESERVED_ATTRS and not key.startswith('_'):
+                entry[key] = value
+        if record.exc_text:
+            entry['exc'] = record.exc_text
+        elif record.exc_info:
+            entry['exc'] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+
+class RequestContextFilter(logging.Filter):
+    """
+    Stamps request_id / team_id / route onto records logged inside a request
+    and applies sampling. Runs on the calling thread, since the request
+    context is gone by the time the listener thread writes the line.
+    """
+
+    def filter(self, record):
+        if has_request_context():
+            record.request_id = getattr(g, 'request_id', None)
+            if not hasattr(record, 'team_id'):
+                record.team_id = request.headers.get('X-Team-ID')
+            record.route = request.url_rule.rule if request.url_rule else request.path
+            sampled = getattr(g, 'log_sampled', True)
+        else:
+            sampled = getattr(record, '_log_sampled', None)
+            if sampled is None:
+                sampled = random() < config.LOG_SAMPLE_RATE
+        return record.levelno >= logging.WARNING or sampled
+
+
+class NonBlockingQueueHandler(QueueHandler):
+    """QueueHandler that drops records when the queue is full instead of blocking."""
+
+    def __init__(self, log_queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record):
+        # Keep the record's extra fields (the default prepare() flattens
+        # everything into msg); only resolve what can't cross threads.
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+def configure_logging():
+    """
+    Route the "server" logger through a queue to a background writer thread.
+    Safe to call more than once.
+    """
+    global _listener, _queue_handler
+    if _listener is not None:
+        return
+
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(JsonFormatter())
+
+    log_queue = queue.Queue(maxsize=config.LOG_QUEUE_SIZE)
+    _queue_handler = NonBlockingQueueHandler(log_queue)
+    _queue_handler.addFilter(RequestContextFilter())
+
+    root = logging.getLogger(ROOT_LOGGER_NAME)
+    root.setLevel(config.LOG_LEVEL)
+    root.addHandler(_queue_handler)
+    root.propagate = False
+
+    _listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    _listener.start()
+    atexit.register(_listener.stop)
+
+
+def get_logger(name: str) -> logging.Logger:
+    """Return a logger that writes through the async JSON pipeline."""
+    configure_logging()
+    return logging.getLogger(name)
+
+
+logger = get_logger(__name__)
+
+
+def _request_id():
+    """Use the client's X-Request-ID if it is short and safe, else make one."""
+    rid = request.headers.get('X-Request-ID', '')
+    return rid if _REQUEST_ID_RE.match(rid) else uuid.uuid4().hex
+
+
+def init_app(app):
+    """
+    Register per-request hooks (request id, sampling decision, timing) and
+    send Flask's and werkzeug's loggers through the same queue, so unhandled
+    exceptions don't fall back to synchronous stderr writes.
+    """
+    for name in (app.logger.name, 'werkzeug'):
+        target = logging.getLogger(name)
+        target.removeHandler(default_handler)
+        target.addHandler(_queue_handler)
+        target.propagate = False
+
+    @app.before_request
+    def _start_request():
+        g.request_id = _request_id()
+        g.log_sampled = random() < config.LOG_SAMPLE_RATE
+        g.request_start = perf_counter()
+
+    @app.after_request
+    def _finish_request(response):
+        start = getattr(g, 'request_start', None)
+        if start is not None:
+            # Logged on close so streamed (SSE) responses report the full
+            # duration. The request context may be gone by then, so the
+            # fields are captured now.
+            extra = {
+                'request_id': g.request_id,
+                'team_id': request.headers.get('X-Team-ID'),
+                'route': request.url_rule.rule if request.url_rule else request.path,
+                'method': request.method,
+                'status': response.status_code,
+                '_log_sampled': g.log_sampled,
+            }
+
+            def _log_completed():
+                extra['duration_ms'] = round((perf_counter() - start) * 1000, 2)
+                logger.info("request completed", extra=extra)
+
+            response.call_on_close(_log_completed)
+        response.headers['X-Request-ID'] = g.get('request_id', '')
+        return response
@@ -0,0 +1,213 @@
+# services/profiling_service.py
+import cProfile
+import hmac
+import os
+import sys
+import threading
+import uuid
+from collections import Counter
+from random import random
+from time import perf_counter, time
+
+from flask import g, request
+
+import server.config as config
+from server.services.logging_service import get_logger
+
+logger = get_logger(__name__)
+
+PROFILES_ROUTE = '/backend-api/v2/profiles'
+
+# cProfile hooks are process-wide from Python 3.12, so only one request per
+# worker is profiled at a time. Requests arriving meanwhile run unprofiled,
+# but they still show up in a pstats profile taken on 3.12+ (see
+# PROFILE_FORMAT in server/config.py).
+_active = threading.Lock()
+
+
+class _CProfileSession:
+    """
+    Deterministic profile written as pstats. Covers only the request thread
+    before Python 3.12, and every thread in the process from 3.12.
+    """
+    ext = 'prof'
+
+    def __init__(self):
+        self.profiler = cProfile.Profile()
+
+    def start(self):
+        self.profiler.enable()
+
+    def pause(self):
+        self.profiler.disable()
+
+    resume = start
+
+    def write(self, path):
+        self.profiler.disable()
+        self.profiler.dump_stats(path)
+
+
+class _StackSampler:
+    """Samples the request thread's stack on a timer, written as collapsed stacks."""
+    ext = 'collapsed'
+
+    def __init__(self, interval):
+        self.interval = interval
+        self.thread_id = threading.get_ident()
+        self.counts = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name='profile-sampler', daemon=True)
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+                frame = frame.f_back
+            if stack:
+                self.counts[';'.join(reversed(stack))] += 1
+
+    def start(self):
+        self._thread.start()
+
+    # Wall-clock sampling: time spent between stream chunks is kept on purpose.
+    def pause(self):
+        pass
+
+    def resume(self):
+        pass
+
+    def write(self, path):
+        self._stop.set()
+        self._thread.join()
+        with open(path, 'w') as f:
+            for stack, count in self.counts.items():
+                f.write(f"{stack} {count}\n")
+
+
+def is_authorized(req) -> bool:
+    """True if the request carries the configured X-Profile token."""
+    token = req.headers.get('X-Profile')
+    if not (config.PROFILE_TOKEN and token):
+        return False
+    # Compare bytes: compare_digest rejects non-ASCII str arguments.
+    return hmac.compare_digest(token.encode(), config.PROFILE_TOKEN.encode())
+
+
+def list_profiles(limit: int = 50) -> list:
+    """Most recent profile files first. Returns an empty list if none exist."""
+    try:
+        entries = [e for e in os.scandir(config.PROFILE_DIR) if e.is_file()]
+    except FileNotFoundError:
+        return []
+    entries.sort(key=lambda e: e.stat().st_mtime, reverse=True)
+    return [
+        {'name': e.name, 'size': e.stat().st_size, 'created': e.stat().st_mtime}
+        for e in entries[:limit]
+    ]
+
+
+def profile_path(name: str):
+    """Resolve a profile file name to a path, or None if it is not a known profile."""
+    if os.path.basename(name) != name:
+        return None
+    path = os.path.join(config.PROFILE_DIR, name)
+    return path if os.path.isfile(path) else None
+
+
+def _prune():
+    for entry in list_profiles(limit=sys.maxsize)[config.PROFILE_KEEP:]:
+        try:
+            os.remove(os.path.join(config.PROFILE_DIR, entry['name']))
+        except OSError:
+            pass
+
+
+def _write_profile(session, name, route, start):
+    try:
+        os.makedirs(config.PROFILE_DIR, exist_ok=True)
+        session.write(os.path.join(config.PROFILE_DIR, name))
+        _prune()
+        logger.info(
+            "Profile written",
+            extra={'profile': name, 'route': route, 'duration_ms': round((perf_counter() - start) * 1000, 2)},
+        )
+    except Exception as e:
+        logger.error("Error writing profile: %s", e)
+    finally:
+        _active.release()
+
+
+def _profiled_stream(session, iterable):
+    """
+    Re-wraps a streamed body so the profiler runs while each chunk is produced.
+    Writing the profile is left to response.call_on_close: this generator's
+    finally never runs if the server closes it unstarted (HEAD, 204, 304).
+    """
+    iterator = iter(iterable)
+    try:
+        while True:
+            session.resume()
+            try:
+                chunk = next(iterator)
+            except StopIteration:
+                break
+            finally:
+                session.pause()
+            yield chunk
+    finally:
+        close = getattr(iterable, 'close', None)
+        if close:
+            close()
+
+
+def init_app(app):
+    """
+    Register the profiling hooks. Nothing is registered unless PROFILE_TOKEN
+    or PROFILE_SAMPLE_RATE is set, so the default cost is zero.
+    """
+    if not config.PROFILE_TOKEN and config.PROFILE_SAMPLE_RATE <= 0:
+        return
+
+    @app.before_request
+    def _start_profile():
+        if request.path.startswith(PROFILES_ROUTE):
+            return
+        if not (is_authorized(request) or random() < config.PROFILE_SAMPLE_RATE):
+            return
+        if not _active.acquire(blocking=False):
+            return
+        if config.PROFILE_FORMAT == 'collapsed':
+            session = _StackSampler(config.PROFILE_INTERVAL)
+        else:
+            session = _CProfileSession()
+        # Server-generated name: nothing client-supplied ends up in a path.
+        g.profile = (session, f"{int(time() * 1000)}-{uuid.uuid4().hex}.{session.ext}", perf_counter())
+        session.start()
+
+    @app.after_request
+    def _finish_profile(response):
+        profile = g.pop('profile', None)
+        if profile is None:
+            return response
+        session, name, start = profile
+        route = request.url_rule.rule if request.url_rule else request.path
+        response.headers['X-Profile-ID'] = name
+        if response.is_streamed:
+            session.pause()
+            response.response = _profiled_stream(session, response.response)
+            response.call_on_close(lambda: _write_profile(session, name, route, start))
+        else:
+            _write_profile(session, name, route, start)
+        return response
+
+    @app.teardown_request
+    def _abandon_profile(exc):
+        # Only reached with a profile still pending if after_request was skipped.
+        profile = g.pop('profile', None)
+        if profile is not None:
+            session, name, start = profile
+            _write_profile(session, name, request.path, start)
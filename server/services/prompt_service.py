@@ -1,7 +1,11 @@
 # services/prompt_service.py
 from datetime import datetime
+from time import perf_counter
 # We assume fetchSkills is in this location, as per your original file
 from server.services.teams_service import fetchSkills 
+from server.services.logging_service import get_logger
+
+logger = get_logger(__name__)
 
 def build_system_prompt(team_id: str, user_id: str, user_email: str) -> str:
     """
@@ -31,12 +35,16 @@ def build_system_prompt(team_id: str, user_id: str, user_email: str) -> str:
 
     # 3. Fetch the skills and combine
     try:
+        start = perf_counter()
         skills_data = fetchSkills(team_id) # e.g., "user1: Python, React\nuser2: Docker"
-        print("Fetched team skills data:", skills_data)  # Debug print
+        logger.debug(
+            "Fetched team skills data",
+            extra={'skills_chars': len(skills_data), 'duration_ms': round((perf_counter() - start) * 1000, 2)},
+        )
 
         team_skills_context += skills_data
     except Exception as e:
-        print(f"Error fetching team skills: {e}")
+        logger.error("Error fetching team skills: %s", e)
         team_skills_context += "[Could not load team skills data.]"
 
     # 4. Return the complete system message